@@ -10,27 +10,38 @@ import os
 # Add build directory to path for module import
 sys.path.insert(0, os.path.join(os.getcwd(), 'bin'))
 
+# Resolve the extension modules once; each test reuses the module objects
+try:
+    # Import the CEE API module (built by nanobind)
+    import wrp_cee as cee
+    _CEE_IMPORT_ERR = None
+except ImportError as e:
+    cee = None
+    _CEE_IMPORT_ERR = e
+
+try:
+    # Import CTE module for Tag and runtime initialization
+    import wrp_cte_core_ext as cte
+    _CTE_IMPORT_ERR = None
+except ImportError as e:
+    cte = None
+    _CTE_IMPORT_ERR = e
+
 def test_module_imports():
     """Test that required modules can be imported"""
     print("Test 1: Module Imports")
 
-    try:
-        # Import the CEE API module (built by nanobind)
-        import wrp_cee as cee
-        print("  ✅ wrp_cee module imported successfully")
-    except ImportError as e:
-        print(f"  ❌ Failed to import wrp_cee module: {e}")
+    if cee is None:
+        print(f"  ❌ Failed to import wrp_cee module: {_CEE_IMPORT_ERR}")
         print("     Make sure WRP_CORE_ENABLE_PYTHON=ON and nanobind is installed")
         return False
+    print("  ✅ wrp_cee module imported successfully")
 
-    try:
-        # Import CTE module for Tag and runtime initialization
-        import wrp_cte_core_ext as cte
-        print("  ✅ wrp_cte_core_ext module imported successfully")
-    except ImportError as e:
-        print(f"  ❌ Failed to import wrp_cte_core_ext module: {e}")
+    if cte is None:
+        print(f"  ❌ Failed to import wrp_cte_core_ext module: {_CTE_IMPORT_ERR}")
         print("     CTE Python bindings are required for runtime initialization")
         return False
+    print("  ✅ wrp_cte_core_ext module imported successfully")
 
     return True
 
@@ -39,9 +50,11 @@ def test_api_construction():
     """Test that API types can be constructed"""
     print("\nTest 2: API Type Construction")
 
-    try:
-        import wrp_cee as cee
+    if cee is None:
+        print(f"  ❌ wrp_cee module unavailable: {_CEE_IMPORT_ERR}")
+        return False
 
+    try:
         # Test ContextInterface construction
         ctx_interface = cee.ContextInterface()
         print("  ✅ ContextInterface constructed successfully")
@@ -66,9 +79,11 @@ def test_cte_types():
     """Test that CTE types are available"""
     print("\nTest 3: CTE Type Availability")
 
-    try:
-        import wrp_cte_core_ext as cte
+    if cte is None:
+        print(f"  ❌ wrp_cte_core_ext module unavailable: {_CTE_IMPORT_ERR}")
+        return False
 
+    try:
         # Test that key types/enums are accessible
         _ = cte.ChimaeraMode.kClient
         print("  ✅ ChimaeraMode enum accessible")